@@ -1,6 +1,8 @@
 import uuid
+import time
 import zipfile
 import io
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Optional
 from fastapi import APIRouter, UploadFile, File, Query, HTTPException
@@ -23,6 +25,15 @@ SESSION_TTL = 3600
 # Share link TTL in seconds (1 hour)
 SHARE_TTL = 3600
 
+# (StatsResponse, deadline) pairs keyed by the full /api/stats parameters.
+# Dashboards re-request the same filter combinations as users toggle
+# options back and forth; sessions are immutable after upload, so a hit
+# can skip both the Firestore read and the recomputation. LRU-bounded,
+# and entries expire with the session so cached stats never outlive the
+# 1-hour retention of the chat data they were derived from.
+_STATS_CACHE: 'OrderedDict[tuple, tuple]' = OrderedDict()
+_STATS_CACHE_SIZE = 128
+
 
 def _generate_session_id() -> str:
     """Generate a unique session ID."""
@@ -218,6 +229,21 @@ def _get_messages_from_session(session_id: Optional[str]):
     return [Message(**msg_dict) for msg_dict in messages_dicts]
 
 
+def _session_deadline(session_data: dict) -> float:
+    """Epoch seconds at which the session's data is deleted.
+
+    Reads the authoritative expires_at written by firestore_client.set
+    (epoch int; ISO string on documents written before it became numeric).
+    """
+    expires_at = session_data.get('expires_at')
+    if expires_at is None:
+        return time.time() + SESSION_TTL
+    if isinstance(expires_at, str):
+        delta = datetime.fromisoformat(expires_at) - datetime.utcfromtimestamp(0)
+        return delta.total_seconds()
+    return float(expires_at)
+
+
 def _get_language_from_session(session_id: Optional[str]) -> str:
     """Get language from session."""
     session_data = _get_session_data(session_id)
@@ -239,14 +265,32 @@ async def get_stats(
     start_date: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
     end_date: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
     time_group: str = Query("day", regex="^(hour|day|week|month)$", description="Time grouping"),
-    group_by_author: bool = Query(False, description="Include author-specific groupings")
+    group_by_author: bool = Query(False, description="Include author-specific groupings"),
+    include_lengths: bool = Query(True, description="Include message length distribution"),
+    include_bestemmiometro: bool = Query(True, description="Include profanity analysis")
 ):
     """Get aggregated statistics with optional filters."""
-    messages = _get_messages_from_session(cache_key)
-    
+    stats_key = (cache_key, authors, start_date, end_date, time_group,
+                 group_by_author, include_lengths, include_bestemmiometro)
+    if cache_key:
+        cached = _STATS_CACHE.get(stats_key)
+        if cached is not None:
+            cached_stats, deadline = cached
+            if time.time() < deadline:
+                _STATS_CACHE.move_to_end(stats_key)
+                return cached_stats
+            # Expired with the session: fall through to the normal path,
+            # which 400s once Firestore has dropped the session data
+            del _STATS_CACHE[stats_key]
+
+    # Fetch the session once: it provides messages, language and the
+    # authoritative expires_at used as the cache entry's deadline
+    session_data = _get_session_data(cache_key)
+    messages = [Message(**msg_dict) for msg_dict in session_data['messages']]
+
     # Build filter parameters
     author_list = [a.strip() for a in authors.split(",")] if authors else None
-    
+
     start_dt = None
     if start_date:
         try:
@@ -262,7 +306,7 @@ async def get_stats(
             raise HTTPException(status_code=400, detail="Invalid end_date format. Use YYYY-MM-DD")
     
     # Filter and compute stats
-    language = _get_language_from_session(cache_key)
+    language = session_data.get('language', 'en')
     stats_service = StatisticsService(messages, language=language)
     filtered_service = stats_service.filter_messages(
         authors=author_list,
@@ -272,9 +316,16 @@ async def get_stats(
     
     stats = filtered_service.compute_stats(
         time_group=time_group,
-        group_by_author=group_by_author
+        group_by_author=group_by_author,
+        include_lengths=include_lengths,
+        include_bestemmiometro=include_bestemmiometro
     )
-    
+
+    if cache_key:
+        _STATS_CACHE[stats_key] = (stats, _session_deadline(session_data))
+        if len(_STATS_CACHE) > _STATS_CACHE_SIZE:
+            _STATS_CACHE.popitem(last=False)
+
     return stats
 
 
@@ -434,7 +485,7 @@ async def create_share_link(cache_key: Optional[str] = Query(None, alias="key"))
         'emoji_stats': emoji_stats,
         'language': language,
         'created_at': datetime.utcnow().isoformat(),
-        'expires_at': expires_at.isoformat(),
+        # expires_at is added by firestore_client.set from the TTL
     }
     
     if not firestore_client.set(f"share:{share_id}", snapshot, SHARE_TTL):
@@ -454,9 +505,12 @@ async def get_shared_data(share_id: str):
     Returns the frozen stats snapshot.
     """
     snapshot = firestore_client.get(f"share:{share_id}")
-    
+
     if not snapshot:
         raise HTTPException(status_code=404, detail="Share link not found or expired")
-    
+
+    # expires_at is the store's internal TTL marker (epoch seconds,
+    # rewritten by firestore_client.set); don't leak it to clients
+    snapshot.pop('expires_at', None)
     return snapshot
 
@@ -1,4 +1,6 @@
 from datetime import datetime
+from functools import cached_property
+
 from pydantic import BaseModel
 
 
@@ -10,6 +12,11 @@ class Message(BaseModel):
     is_system: bool = False
     is_media: bool = False
 
+    @cached_property
+    def content_lower(self) -> str:
+        """Lowercase content, computed once and reused by the analyzers."""
+        return self.content.lower() if self.content else ''
+
     class Config:
         json_encoders = {
             datetime: lambda v: v.isoformat()
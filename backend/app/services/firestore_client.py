@@ -1,5 +1,6 @@
-from google.cloud import firestore
-from datetime import datetime, timedelta
+import time
+
+from datetime import datetime
 
 class FirestoreClient:
     def __init__(self):
@@ -22,11 +23,19 @@ class FirestoreClient:
                 self.db._client_info = None  # Clear client info for emulator
                 self.db._client_options = None
             else:
+                # Imported here (not at module top): google.cloud.firestore pulls in
+                # grpc and friends, which costs hundreds of ms at cold start
+                from google.cloud import firestore
                 self.db = firestore.Client(project=project_id)
             
             print(f"[INFO] Firestore client created for project: {self.db.project}")
             self.sessions_collection = self.db.collection('sessions')
             self.shares_collection = self.db.collection('shares')
+            # Resolve key prefixes once here instead of branching in every set/get/delete
+            self._collections = {
+                'session': self.sessions_collection,
+                'share': self.shares_collection,
+            }
             print("[INFO] Firestore client initialized successfully")
         except Exception as e:
             print(f"[ERROR] Failed to initialize Firestore client: {str(e)}")
@@ -34,6 +43,14 @@ class FirestoreClient:
             traceback.print_exc()
             raise
 
+    def _resolve_document(self, key: str):
+        """Map a 'session:<id>' / 'share:<id>' key to its document reference."""
+        prefix, _, doc_id = key.partition(':')
+        collection = self._collections.get(prefix)
+        if collection is None or not doc_id:
+            raise ValueError(f"Invalid key format: {key}")
+        return collection.document(doc_id)
+
     def set(self, key: str, data: dict, ttl_seconds: int = None) -> bool:
         """
         Store data in Firestore with optional TTL.
@@ -42,16 +59,7 @@ class FirestoreClient:
         """
         try:
             print(f"[INFO] Firestore set: key={key}, ttl={ttl_seconds}")
-            if key.startswith('session:'):
-                collection = self.sessions_collection
-                doc_id = key.replace('session:', '')
-            elif key.startswith('share:'):
-                collection = self.shares_collection
-                doc_id = key.replace('share:', '')
-            else:
-                raise ValueError(f"Invalid key format: {key}")
-
-            doc_ref = collection.document(doc_id)
+            doc_ref = self._resolve_document(key)
 
             # Handle large messages by storing in subcollection
             messages = data.pop('messages', None)
@@ -95,9 +103,9 @@ class FirestoreClient:
                 
                 print(f"[INFO] Stored {len(messages)} messages in {(len(messages) + 99) // 100} chunks")
 
-            # Store metadata
+            # Store metadata (epoch seconds: cheap int compare on read, no string parsing)
             if ttl_seconds:
-                data['expires_at'] = (datetime.utcnow() + timedelta(seconds=ttl_seconds)).isoformat()
+                data['expires_at'] = int(time.time()) + ttl_seconds
 
             doc_ref.set(data)
             print(f"[INFO] Firestore set successful for {key}")
@@ -115,16 +123,7 @@ class FirestoreClient:
         Returns None if not found or expired.
         """
         try:
-            if key.startswith('session:'):
-                collection = self.sessions_collection
-                doc_id = key.replace('session:', '')
-            elif key.startswith('share:'):
-                collection = self.shares_collection
-                doc_id = key.replace('share:', '')
-            else:
-                raise ValueError(f"Invalid key format: {key}")
-
-            doc_ref = collection.document(doc_id)
+            doc_ref = self._resolve_document(key)
             doc = doc_ref.get()
 
             if not doc.exists:
@@ -134,8 +133,13 @@ class FirestoreClient:
 
             # Check expiration
             if 'expires_at' in data:
-                expires_at = datetime.fromisoformat(data['expires_at'])
-                if datetime.utcnow() > expires_at:
+                expires_at = data['expires_at']
+                if isinstance(expires_at, str):
+                    # Documents written before expires_at became numeric
+                    expired = datetime.utcnow() > datetime.fromisoformat(expires_at)
+                else:
+                    expired = time.time() > expires_at
+                if expired:
                     # Delete expired document and subcollection
                     self._delete_with_subcollection(doc_ref)
                     return None
@@ -160,16 +164,7 @@ class FirestoreClient:
         Delete a document and its subcollections from Firestore.
         """
         try:
-            if key.startswith('session:'):
-                collection = self.sessions_collection
-                doc_id = key.replace('session:', '')
-            elif key.startswith('share:'):
-                collection = self.shares_collection
-                doc_id = key.replace('share:', '')
-            else:
-                raise ValueError(f"Invalid key format: {key}")
-
-            doc_ref = collection.document(doc_id)
+            doc_ref = self._resolve_document(key)
             self._delete_with_subcollection(doc_ref)
             return True
         except Exception as e:
@@ -190,5 +185,16 @@ class FirestoreClient:
         batch.delete(doc_ref)
         batch.commit()
 
-# Global instance
-firestore_client = FirestoreClient()
\ No newline at end of file
+class _LazyFirestoreClient:
+    """Defers FirestoreClient construction to the first actual Firestore call,
+    so importing this module (e.g. from the API routes) stays cheap."""
+    _instance = None
+
+    def __getattr__(self, name):
+        if _LazyFirestoreClient._instance is None:
+            _LazyFirestoreClient._instance = FirestoreClient()
+        return getattr(_LazyFirestoreClient._instance, name)
+
+
+# Global instance (initialized lazily on first use)
+firestore_client = _LazyFirestoreClient()
\ No newline at end of file
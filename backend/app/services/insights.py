@@ -1,6 +1,5 @@
 from typing import List
 from collections import Counter
-from statistics import mean
 
 from ..models.message import Message
 from ..models.stats import Insight, InsightResponse
@@ -260,10 +259,16 @@ class InsightsGenerator:
                 category="words"
             ))
         
-        # Average message length
-        lengths = [len(m.content) for m in self.user_messages if m.content and not m.is_media]
-        if lengths:
-            avg_length = mean(lengths)
+        # Average message length (running sums; statistics.mean is
+        # Fraction-based and far slower than a plain division)
+        total_chars = 0
+        text_count = 0
+        for m in self.user_messages:
+            if m.content and not m.is_media:
+                total_chars += len(m.content)
+                text_count += 1
+        if text_count:
+            avg_length = total_chars / text_count
             insights.append(Insight(
                 title=self.tr['avg_message_length_title'],
                 description=self.tr['avg_message_length_desc'].format(avg=avg_length),
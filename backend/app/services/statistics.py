@@ -1,9 +1,12 @@
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import List, Dict, Optional, Any
 from collections import defaultdict
-import statistics
+from functools import lru_cache
+import heapq
 import re
 
+import numpy as np
+
 from ..models.message import Message
 from ..models.stats import (
     StatsResponse, AuthorStats,
@@ -11,6 +14,188 @@ from ..models.stats import (
 )
 
 
+# Words ending in repeated vowels (3+ repetitions), e.g. "porco diooooo",
+# "madonnaaaa" - the emotional intensity/"climax" of the expression.
+# Compiled once here instead of on every _detect_climax_patterns call.
+# Case-sensitive on purpose: every caller scans pre-lowercased text, and
+# skipping IGNORECASE spares the engine per-character case folding.
+_CLIMAX_PATTERN = re.compile(
+    r'\b(\w*?)((?:dio|porco|madonna|cane|merda|bestia|boia|maiale)\w*?)([aeiou])(\3{2,})\b'
+)
+
+
+@lru_cache(maxsize=4)
+def _load_profanity_patterns(language: str) -> tuple:
+    """
+    Load profanity patterns based on language.
+    Italian: bestemmie.txt (blasphemies)
+    English: swearwords.txt (profanity)
+
+    The patterns depend only on the language and the static word files, so
+    the result is cached per process: file I/O and the re.compile calls run
+    once per language instead of on every compute_stats call.
+
+    Returns (patterns, combined, group_to_phrase, triggers) where `patterns`
+    maps each canonical phrase to its compiled pattern, `combined` is a
+    single alternation of all phrases as named groups (one scan per message
+    instead of one per phrase), `group_to_phrase` maps the named group back
+    to the canonical phrase, and `triggers` is a tuple of lowercase
+    substrings for prefiltering (None when the set is too large to pay off).
+    """
+    import os
+    pattern_strs = {}
+
+    # Select file based on language
+    filename = 'bestemmie.txt' if language == 'it' else 'swearwords.txt'
+
+    # Try multiple paths (local dev vs Docker)
+    possible_paths = [
+        # Docker path: /app/data/
+        os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data', filename),
+        # Local dev path: project_root/data/
+        os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), 'data', filename),
+    ]
+
+    file_path = None
+    for path in possible_paths:
+        if os.path.exists(path):
+            file_path = path
+            break
+
+    if not file_path:
+        # Fallback patterns based on language
+        if language == 'it':
+            pattern_strs = {
+                'porco dio': r'\bporco\s*di+o+\b',
+                'dio porco': r'\bdio\s*porco\b',
+                'porca madonna': r'\bporca\s*madonna\b',
+                'dio cane': r'\bdio\s*cane\b',
+            }
+        else:
+            pattern_strs = {
+                'fuck': r'\bfuck\w*\b',
+                'shit': r'\bshit\w*\b',
+                'damn': r'\bdamn\w*\b',
+                'ass': r'\bass(?:hole)?\b',
+            }
+    else:
+        seen_patterns = set()
+        with open(file_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                phrase = line.strip().lower()
+                if not phrase or phrase in seen_patterns:
+                    continue
+                seen_patterns.add(phrase)
+
+                # Create pattern that handles word boundaries
+                words = phrase.split()
+                if len(words) >= 2:
+                    # Multi-word: allow optional spaces
+                    pattern_str = r'\b' + r'\s*'.join(re.escape(w) for w in words) + r'\b'
+                elif len(words) == 1:
+                    # Single word - match with optional suffixes for English
+                    if language == 'en':
+                        pattern_str = r'\b' + re.escape(phrase) + r'\w*\b'
+                    else:
+                        pattern_str = r'\b' + re.escape(phrase) + r'\b'
+                else:
+                    continue
+
+                # Normalize pattern name
+                canonical = ' '.join(words) if len(words) > 1 else phrase
+                pattern_strs[canonical] = pattern_str
+
+    # The phrases are lower-cased above and every caller scans lowercase
+    # text, so the patterns compile case-sensitive: IGNORECASE would make
+    # the engine case-fold each character for nothing.
+    patterns = {}
+    for phrase, pattern_str in pattern_strs.items():
+        try:
+            patterns[phrase] = re.compile(pattern_str)
+        except re.error:
+            continue
+
+    # Build one big alternation so each message is scanned once rather
+    # than once per phrase. Longer phrases come first so 'porco dio'
+    # wins over a bare 'dio' sharing the same start position.
+    ordered = sorted(patterns, key=len, reverse=True)
+    group_to_phrase = {f'g{i}': phrase for i, phrase in enumerate(ordered)}
+    combined = re.compile(
+        '|'.join(f'(?P<g{i}>{pattern_strs[phrase]})' for i, phrase in enumerate(ordered))
+    ) if ordered else None
+
+    # Cheap substring prefilter: most messages contain no profanity at all,
+    # so a few C-level `in` checks can reject them before the alternation
+    # runs. Only worth it while the trigger set stays small (the English
+    # word list has ~800 distinct prefixes, where the scan itself is cheaper).
+    trigger_set = {phrase.split()[0][:4] for phrase in pattern_strs}
+    if language == 'it':
+        # Include the climax roots so the climax scan shares the prefilter
+        trigger_set.update(
+            root[:4] for root in
+            ('dio', 'porco', 'madonna', 'cane', 'merda', 'bestia', 'boia', 'maiale')
+        )
+    triggers = tuple(sorted(trigger_set)) if 0 < len(trigger_set) <= 64 else None
+
+    return patterns, combined, group_to_phrase, triggers
+
+
+# Below this many scannable messages the profanity scan runs inline; above
+# it, the contents are sharded across worker processes. The threshold keeps
+# process startup and pickling costs away from ordinary chats.
+_PARALLEL_SCAN_MIN = 50_000
+
+
+def _scan_contents(contents: List[str], language: str) -> list:
+    """
+    Run the combined profanity scan (and, for Italian, climax detection)
+    over a list of already-lowercased message contents.
+
+    Returns one entry per content: None when nothing matched, otherwise a
+    (phrases, climaxes) tuple with the matched canonical phrases and climax
+    detections. Module-level (and operating on plain strings) so worker
+    processes can run it over content shards.
+    """
+    _, combined, group_to_phrase, triggers = _load_profanity_patterns(language)
+    detect_climax = language == 'it'
+    results = []
+
+    for content in contents:
+        # Fast reject: only run the regex scans when a trigger substring
+        # occurs in the message (the common case is that none does)
+        if triggers is not None and not any(t in content for t in triggers):
+            results.append(None)
+            continue
+
+        phrases = (
+            [group_to_phrase[m.lastgroup] for m in combined.finditer(content)]
+            if combined is not None else []
+        )
+        climaxes = StatisticsService._detect_climax_patterns(content) if detect_climax else []
+        results.append((phrases, climaxes) if phrases or climaxes else None)
+
+    return results
+
+
+def _scan_contents_parallel(contents: List[str], language: str) -> list:
+    """Shard _scan_contents across worker processes for very large chats."""
+    import os
+    from concurrent.futures import ProcessPoolExecutor
+    from itertools import repeat
+
+    workers = min(os.cpu_count() or 1, 4)
+    if workers <= 1:
+        return _scan_contents(contents, language)
+
+    chunk_size = (len(contents) + workers - 1) // workers
+    chunks = [contents[i:i + chunk_size] for i in range(0, len(contents), chunk_size)]
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for part in pool.map(_scan_contents, chunks, repeat(language)):
+            results.extend(part)
+    return results
+
+
 class StatisticsService:
     """Service for computing conversation statistics."""
     
@@ -18,6 +203,10 @@ class StatisticsService:
         self.messages = messages
         self.filtered_messages = messages
         self.language = language
+        # Columnar view of the messages, built lazily by _materialize_columns
+        self._columns = None
+        # time_group -> (unique_buckets, bucket_ids) over the user rows
+        self._bucket_cache = {}
     
     def filter_messages(
         self,
@@ -26,31 +215,48 @@ class StatisticsService:
         end_date: Optional[datetime] = None
     ) -> 'StatisticsService':
         """Filter messages and return a new service instance with filtered data."""
-        filtered = self.messages
-        
+        if not (authors or start_date or end_date) or not self.messages:
+            return StatisticsService(self.messages, language=self.language)
+
+        # One vectorized AND over the cached columns instead of a Python
+        # list pass (and list allocation) per filter criterion
+        columns = self._materialize_columns()
+        mask = np.ones(len(self.messages), dtype=bool)
+
         if authors:
-            filtered = [m for m in filtered if m.author in authors]
-        
+            author_to_id = {a: i for i, a in enumerate(columns['authors'])}
+            wanted = [author_to_id[a] for a in authors if a in author_to_id]
+            mask &= np.isin(columns['author_ids'], wanted)
+
         if start_date:
-            filtered = [m for m in filtered if m.timestamp >= start_date]
-        
+            mask &= columns['ts'] >= np.datetime64(start_date)
+
         if end_date:
-            filtered = [m for m in filtered if m.timestamp <= end_date]
-        
-        service = StatisticsService(filtered, language=self.language)
-        return service
+            mask &= columns['ts'] <= np.datetime64(end_date)
+
+        # Message is iterable (pydantic), so fill an object array explicitly
+        messages_array = np.empty(len(self.messages), dtype=object)
+        messages_array[:] = self.messages
+        filtered = messages_array[mask].tolist()
+
+        return StatisticsService(filtered, language=self.language)
     
     def compute_stats(
         self,
         time_group: str = 'day',
-        group_by_author: bool = False
+        group_by_author: bool = False,
+        include_lengths: bool = True,
+        include_bestemmiometro: bool = True
     ) -> StatsResponse:
         """
         Compute comprehensive statistics.
-        
+
         Args:
             time_group: One of 'hour', 'day', 'week', 'month'
             group_by_author: Whether to include author-specific stats
+            include_lengths: Whether to include the message length distribution
+            include_bestemmiometro: Whether to run the profanity analysis
+                (the most expensive pass; skip it for views that don't show it)
         """
         messages = self.filtered_messages
         user_messages = [m for m in messages if not m.is_system]
@@ -58,26 +264,28 @@ class StatisticsService:
         if not user_messages:
             return self._empty_stats_response()
         
-        # Basic stats
+        # Basic stats straight from the columns: the author count falls out
+        # of the factorized ids and the date range from two array reductions,
+        # instead of a set-building pass plus two min/max passes
+        columns = self._materialize_columns()
+        user_mask = columns['user_mask']
         total_messages = len(user_messages)
-        authors = list(set(m.author for m in user_messages))
-        total_authors = len(authors)
-        
-        # Date range
-        timestamps = [m.timestamp for m in user_messages]
+        total_authors = int(np.unique(columns['author_ids'][user_mask]).size)
+
+        user_ts = columns['ts'][user_mask]
         date_range = {
-            'start': min(timestamps) if timestamps else None,
-            'end': max(timestamps) if timestamps else None
+            'start': user_ts.min().tolist(),
+            'end': user_ts.max().tolist()
         }
         
         # Author stats
-        author_stats = self._compute_author_stats(user_messages)
+        author_stats = self._compute_author_stats()
         
         # Media statistics
-        media_stats = self._compute_media_stats(user_messages, time_group)
+        media_stats = self._compute_media_stats(time_group)
         
         # Time series
-        time_series = self._compute_time_series(user_messages, time_group)
+        time_series = self._compute_time_series(time_group)
         
         # Hourly breakdown for day grouping
         hourly_breakdown = None
@@ -87,15 +295,17 @@ class StatisticsService:
         # Grouped data
         grouped_data = {}
         if group_by_author:
-            grouped_data['by_author'] = self._group_by_author(user_messages, time_group)
+            grouped_data['by_author'] = self._group_by_author(time_group)
         if hourly_breakdown:
             grouped_data['hourly'] = hourly_breakdown
         
         # Message length distribution
-        grouped_data['message_lengths'] = self._compute_message_length_distribution(user_messages)
-        
+        if include_lengths:
+            grouped_data['message_lengths'] = self._compute_message_length_distribution()
+
         # Bestemmiometro - Italian blasphemy counter
-        grouped_data['bestemmiometro'] = self._compute_bestemmiometro(user_messages)
+        if include_bestemmiometro:
+            grouped_data['bestemmiometro'] = self._compute_bestemmiometro()
         
         return StatsResponse(
             total_messages=total_messages,
@@ -107,231 +317,230 @@ class StatisticsService:
             grouped_data=grouped_data
         )
     
-    def _compute_author_stats(self, messages: List[Message]) -> List[AuthorStats]:
+    def _materialize_columns(self) -> Dict[str, Any]:
+        """
+        Extract the per-message attributes used by the aggregations into
+        parallel numpy columns, built once per service instance.
+
+        Walking the Message list re-touches every object per pass; the
+        columns let each aggregation run as one vectorized operation over
+        contiguous arrays instead. Keys: 'ts' (datetime64[s]), 'author_ids'
+        (int32 index into 'authors'), 'authors' (unique author names),
+        'content_len' (int32, 0 when empty), 'is_media', 'is_system' and
+        'user_mask' (= ~is_system) as bool arrays.
+        """
+        if self._columns is None:
+            messages = self.filtered_messages
+            n = len(messages)
+
+            author_to_id = {}
+            author_ids = np.empty(n, dtype=np.int32)
+            for i, msg in enumerate(messages):
+                author_ids[i] = author_to_id.setdefault(msg.author, len(author_to_id))
+
+            columns = {
+                'ts': np.array([m.timestamp for m in messages], dtype='datetime64[s]'),
+                'author_ids': author_ids,
+                'authors': list(author_to_id),
+                'content_len': np.fromiter(
+                    (len(m.content) if m.content else 0 for m in messages),
+                    dtype=np.int32, count=n
+                ),
+                'is_media': np.fromiter((m.is_media for m in messages), dtype=bool, count=n),
+                'is_system': np.fromiter((m.is_system for m in messages), dtype=bool, count=n),
+            }
+            columns['user_mask'] = ~columns['is_system']
+            self._columns = columns
+
+        return self._columns
+
+    def _compute_author_stats(self) -> List[AuthorStats]:
         """Compute statistics per author."""
-        author_data = defaultdict(lambda: {'messages': [], 'media_count': 0})
-        
-        for msg in messages:
-            author_data[msg.author]['messages'].append(msg)
-            if msg.is_media:
-                author_data[msg.author]['media_count'] += 1
-        
-        stats = []
-        for author, data in author_data.items():
-            msg_list = data['messages']
-            message_lengths = [len(msg.content) for msg in msg_list if msg.content]
-            avg_length = statistics.mean(message_lengths) if message_lengths else 0
-            total_chars = sum(message_lengths)
-            
-            stats.append(AuthorStats(
-                author=author,
-                message_count=len(msg_list),
-                avg_message_length=avg_length,
-                total_chars=total_chars,
-                media_count=data['media_count']
-            ))
-        
-        # Sort by message count descending
-        stats.sort(key=lambda x: x.message_count, reverse=True)
-        return stats
+        columns = self._materialize_columns()
+        user_mask = columns['user_mask']
+        author_ids = columns['author_ids'][user_mask]
+        content_len = columns['content_len'][user_mask]
+        is_media = columns['is_media'][user_mask]
+        authors = columns['authors']
+        n_authors = len(authors)
+
+        # One weighted bincount per aggregate instead of per-author Python loops
+        counts = np.bincount(author_ids, minlength=n_authors)
+        total_chars = np.bincount(author_ids, weights=content_len, minlength=n_authors).astype(np.int64)
+        media_counts = np.bincount(author_ids[is_media], minlength=n_authors)
+        nonempty_counts = np.bincount(author_ids[content_len > 0], minlength=n_authors)
+        avg_lengths = total_chars / np.maximum(nonempty_counts, 1)
+
+        # Sort by message count descending (stable, to keep tie order deterministic)
+        order = np.argsort(-counts, kind='stable')
+        return [
+            AuthorStats(
+                author=authors[i],
+                message_count=int(counts[i]),
+                avg_message_length=float(avg_lengths[i]),
+                total_chars=int(total_chars[i]),
+                media_count=int(media_counts[i])
+            )
+            for i in order if counts[i] > 0
+        ]
     
-    def _compute_time_series(
-        self,
-        messages: List[Message],
-        time_group: str
-    ) -> List[TimeSeriesDataPoint]:
+    def _compute_time_series(self, time_group: str) -> List[TimeSeriesDataPoint]:
         """Compute time series data grouped by time period."""
-        grouped = defaultdict(int)
-        
-        for msg in messages:
-            key = self._get_time_key(msg.timestamp, time_group)
-            grouped[key] += 1
-        
-        # Convert to sorted list
-        series = [
+        unique_buckets, bucket_ids = self._user_buckets(time_group)
+        if unique_buckets.size == 0:
+            return []
+
+        counts = np.bincount(bucket_ids, minlength=unique_buckets.size)
+        return [
             TimeSeriesDataPoint(timestamp=key, value=count)
-            for key, count in sorted(grouped.items())
+            for key, count in zip(unique_buckets.astype('datetime64[s]').tolist(), counts.tolist())
         ]
-        
-        return series
-    
-    def _get_time_key(self, timestamp: datetime, time_group: str) -> datetime:
-        """Get time key for grouping."""
-        if time_group == 'hour':
-            return timestamp.replace(minute=0, second=0, microsecond=0)
-        elif time_group == 'day':
-            return timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    def _user_buckets(self, time_group: str) -> tuple:
+        """
+        Unique (sorted) time buckets and the per-message bucket id for the
+        user rows, cached per time_group so the time series, media stats and
+        per-author grouping all share one bucketing pass.
+        """
+        cached = self._bucket_cache.get(time_group)
+        if cached is None:
+            columns = self._materialize_columns()
+            ts = columns['ts'][columns['user_mask']]
+            buckets = self._bucket_timestamps(ts, time_group)
+            cached = np.unique(buckets, return_inverse=True)
+            self._bucket_cache[time_group] = cached
+        return cached
+
+    @staticmethod
+    def _bucket_timestamps(ts: np.ndarray, time_group: str) -> np.ndarray:
+        """Truncate a datetime64[s] array to the requested grouping period."""
+        if time_group == 'day':
+            return ts.astype('datetime64[D]')
         elif time_group == 'week':
-            # Start of week (Monday)
-            days_since_monday = timestamp.weekday()
-            week_start = timestamp - timedelta(days=days_since_monday)
-            return week_start.replace(hour=0, minute=0, second=0, microsecond=0)
+            # Start of week (Monday); Unix day 0 was a Thursday, so +3 aligns
+            days = ts.astype('datetime64[D]').astype(np.int64)
+            return (days - (days + 3) % 7).astype('datetime64[D]')
         elif time_group == 'month':
-            return timestamp.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+            return ts.astype('datetime64[M]')
         else:
-            return timestamp.replace(minute=0, second=0, microsecond=0)
+            # 'hour' and the fallback grouping
+            return ts.astype('datetime64[h]')
     
-    def _group_by_author(
-        self,
-        messages: List[Message],
-        time_group: str
-    ) -> Dict[str, List[TimeSeriesDataPoint]]:
+    def _group_by_author(self, time_group: str) -> Dict[str, List[TimeSeriesDataPoint]]:
         """Group messages by author and time."""
-        author_groups = defaultdict(lambda: defaultdict(int))
-        
-        for msg in messages:
-            author = msg.author
-            time_key = self._get_time_key(msg.timestamp, time_group)
-            author_groups[author][time_key] += 1
-        
+        columns = self._materialize_columns()
+        user_mask = columns['user_mask']
+        author_ids = columns['author_ids'][user_mask]
+        authors = columns['authors']
+
+        unique_buckets, bucket_ids = self._user_buckets(time_group)
+
+        # Flat (author x bucket) count matrix filled in one vectorized pass,
+        # replacing the nested defaultdict with two dict lookups per message
+        counts = np.zeros((len(authors), len(unique_buckets)), dtype=np.int32)
+        np.add.at(counts, (author_ids, bucket_ids), 1)
+
+        bucket_datetimes = unique_buckets.astype('datetime64[s]').tolist()
         result = {}
-        for author, time_data in author_groups.items():
-            result[author] = [
-                TimeSeriesDataPoint(timestamp=key, value=count)
-                for key, count in sorted(time_data.items())
-            ]
-        
+        for author_id, author in enumerate(authors):
+            row = counts[author_id]
+            nonzero = np.flatnonzero(row)
+            if nonzero.size:
+                result[author] = [
+                    TimeSeriesDataPoint(timestamp=bucket_datetimes[i], value=int(row[i]))
+                    for i in nonzero
+                ]
+
         return result
     
-    def _compute_media_stats(
-        self,
-        messages: List[Message],
-        time_group: str
-    ) -> MediaStats:
+    def _compute_media_stats(self, time_group: str) -> MediaStats:
         """Compute statistics about media messages."""
-        # Count total media
-        total_media = sum(1 for msg in messages if msg.is_media)
-        media_percentage = (total_media / len(messages) * 100) if messages else 0.0
-        
-        # Count media by author
-        media_by_author = defaultdict(int)
-        for msg in messages:
-            if msg.is_media:
-                media_by_author[msg.author] += 1
-        
-        # Compute media over time
-        media_messages = [msg for msg in messages if msg.is_media]
-        media_over_time = self._compute_time_series(media_messages, time_group)
-        
+        columns = self._materialize_columns()
+        user_mask = columns['user_mask']
+        is_media = columns['is_media'][user_mask]
+        author_ids = columns['author_ids'][user_mask]
+        authors = columns['authors']
+
+        total_media = int(is_media.sum())
+        n_user = is_media.size
+        media_percentage = (total_media / n_user * 100) if n_user else 0.0
+
+        media_counts = np.bincount(author_ids[is_media], minlength=len(authors))
+        media_by_author = {
+            authors[i]: int(media_counts[i]) for i in np.flatnonzero(media_counts)
+        }
+
+        # Reuse the shared bucket ids rather than materializing a
+        # media_messages list and re-bucketing its timestamps
+        media_over_time = []
+        if total_media:
+            unique_buckets, bucket_ids = self._user_buckets(time_group)
+            media_per_bucket = np.bincount(bucket_ids[is_media], minlength=unique_buckets.size)
+            bucket_datetimes = unique_buckets.astype('datetime64[s]').tolist()
+            media_over_time = [
+                TimeSeriesDataPoint(timestamp=bucket_datetimes[i], value=int(media_per_bucket[i]))
+                for i in np.flatnonzero(media_per_bucket)
+            ]
+
         return MediaStats(
             total_media=total_media,
             media_percentage=media_percentage,
-            media_by_author=dict(media_by_author),
+            media_by_author=media_by_author,
             media_over_time=media_over_time
         )
     
-    def _compute_message_length_distribution(self, messages: List[Message]) -> List[int]:
-        """Extract all message lengths for histogram visualization."""
-        return [len(msg.content) for msg in messages if msg.content and not msg.is_media]
-    
-    def _load_profanity_patterns(self) -> Dict[str, re.Pattern]:
+    # Lengths above this are clamped into the last histogram bin
+    _LENGTH_HISTOGRAM_CAP = 1000
+
+    def _compute_message_length_distribution(self) -> Dict[str, Any]:
         """
-        Load profanity patterns based on language.
-        Italian: bestemmie.txt (blasphemies)
-        English: swearwords.txt (profanity)
+        Histogram of message lengths for visualization.
+
+        Returns {'bins': counts, 'max': cap} where counts[i] is the number
+        of messages of length i, with lengths above the cap clamped into
+        the last bin. Bounded payload (cap+1 ints) instead of one raw
+        length per message.
         """
-        import os
-        patterns = {}
-        
-        # Select file based on language
-        filename = 'bestemmie.txt' if self.language == 'it' else 'swearwords.txt'
-        
-        # Try multiple paths (local dev vs Docker)
-        possible_paths = [
-            # Docker path: /app/data/
-            os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data', filename),
-            # Local dev path: project_root/data/
-            os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), 'data', filename),
-        ]
-        
-        file_path = None
-        for path in possible_paths:
-            if os.path.exists(path):
-                file_path = path
-                break
-        
-        if not file_path:
-            # Fallback patterns based on language
-            if self.language == 'it':
-                return {
-                    'porco dio': re.compile(r'\bporco\s*di+o+\b', re.IGNORECASE),
-                    'dio porco': re.compile(r'\bdio\s*porco\b', re.IGNORECASE),
-                    'porca madonna': re.compile(r'\bporca\s*madonna\b', re.IGNORECASE),
-                    'dio cane': re.compile(r'\bdio\s*cane\b', re.IGNORECASE),
-                }
-            else:
-                return {
-                    'fuck': re.compile(r'\bfuck\w*\b', re.IGNORECASE),
-                    'shit': re.compile(r'\bshit\w*\b', re.IGNORECASE),
-                    'damn': re.compile(r'\bdamn\w*\b', re.IGNORECASE),
-                    'ass': re.compile(r'\bass(?:hole)?\b', re.IGNORECASE),
-                }
-        
-        seen_patterns = set()
-        with open(file_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                phrase = line.strip().lower()
-                if not phrase or phrase in seen_patterns:
-                    continue
-                seen_patterns.add(phrase)
-                
-                # Create pattern that handles word boundaries
-                words = phrase.split()
-                if len(words) >= 2:
-                    # Multi-word: allow optional spaces
-                    pattern_str = r'\b' + r'\s*'.join(re.escape(w) for w in words) + r'\b'
-                elif len(words) == 1:
-                    # Single word - match with optional suffixes for English
-                    if self.language == 'en':
-                        pattern_str = r'\b' + re.escape(phrase) + r'\w*\b'
-                    else:
-                        pattern_str = r'\b' + re.escape(phrase) + r'\b'
-                else:
-                    continue
-                
-                # Normalize pattern name
-                canonical = ' '.join(words) if len(words) > 1 else phrase
-                
-                try:
-                    patterns[canonical] = re.compile(pattern_str, re.IGNORECASE)
-                except re.error:
-                    continue
-        
-        return patterns
+        columns = self._materialize_columns()
+        mask = columns['user_mask'] & ~columns['is_media'] & (columns['content_len'] > 0)
+        lengths = np.minimum(columns['content_len'][mask], self._LENGTH_HISTOGRAM_CAP)
+        bins = (
+            np.bincount(lengths, minlength=self._LENGTH_HISTOGRAM_CAP + 1).tolist()
+            if lengths.size else []
+        )
+        return {'bins': bins, 'max': self._LENGTH_HISTOGRAM_CAP}
     
-    def _detect_climax_patterns(self, content: str) -> List[Dict[str, Any]]:
+    def _load_profanity_patterns(self) -> tuple:
+        """Load the (cached) profanity patterns for this service's language."""
+        return _load_profanity_patterns(self.language)
+
+    @staticmethod
+    def _detect_climax_patterns(content: str) -> List[Dict[str, Any]]:
         """
         Detect climax patterns where vowels are repeated for emphasis.
         E.g., "porco diooooo", "diooooo", "madonnaaaa"
+        Expects already-lowercased content.
         Returns list of detected climax instances with intensity score.
         """
         climax_matches = []
-        content_lower = content.lower()
-        
-        # Pattern to find words ending in repeated vowels (3+ repetitions)
-        # This captures the emotional intensity/"climax" of the expression
-        climax_pattern = re.compile(
-            r'\b(\w*?)((?:dio|porco|madonna|cane|merda|bestia|boia|maiale)\w*?)([aeiou])\3{2,}\b',
-            re.IGNORECASE
-        )
-        
-        for match in climax_pattern.finditer(content_lower):
-            full_match = match.group(0)
-            repeated_vowel = match.group(3)
-            repetitions = len(full_match) - len(full_match.rstrip(repeated_vowel)) + 1
-            
+
+        for match in _CLIMAX_PATTERN.finditer(content):
+            # Length of the repeated-vowel run, straight from the match spans
+            # (group 3 is the vowel, group 4 its repetitions)
+            repetitions = match.end(4) - match.start(4) + 1
+
             # Intensity score based on repetitions (3 = mild, 5+ = intense)
             intensity = min(repetitions - 2, 5)  # Cap at 5
-            
+
             climax_matches.append({
-                'text': full_match,
+                'text': match.group(0),
                 'intensity': intensity,
                 'repetitions': repetitions
             })
-        
+
         return climax_matches
     
-    def _compute_bestemmiometro(self, messages: List[Message]) -> Dict[str, Any]:
+    def _compute_bestemmiometro(self) -> Dict[str, Any]:
         """
         Compute profanity statistics.
         Italian: Bestemmiometro (blasphemies from bestemmie.txt)
@@ -347,105 +556,102 @@ class StatisticsService:
         Returns counts by phrase, by author, total, patterns, and per-capita stats.
         """
         # Load patterns from file based on language
-        PROFANITY_PATTERNS = self._load_profanity_patterns()
-        
-        # Initialize counters
-        by_phrase = {phrase: 0 for phrase in PROFANITY_PATTERNS}
-        by_author = defaultdict(lambda: {phrase: 0 for phrase in PROFANITY_PATTERNS})
+        PROFANITY_PATTERNS = self._load_profanity_patterns()[0]
+        
+        # Initialize counters. Phrase totals live in a primitive int array
+        # (indexed via phrase_index) instead of a dict of boxed ints - the
+        # English list has ~1400 phrases, so the per-call dict of zeros and
+        # the PyLong churn on increments were measurable.
+        phrases_list = list(PROFANITY_PATTERNS)
+        phrase_index = {phrase: idx for idx, phrase in enumerate(phrases_list)}
+        phrase_counts = np.zeros(len(phrases_list), dtype=np.int64)
+        # Flat (author, phrase)-keyed counts: one dict update per hit instead
+        # of a nested lookup, and no full-width per-author phrase dict is
+        # ever allocated. Unflattened once at return time.
+        by_author_phrase = defaultdict(int)
         by_author_total = defaultdict(int)
-        by_author_message_count = defaultdict(int)
         total = 0
-        
-        # Track consecutive patterns and climax
-        consecutive_profanities = []  # List of (author, count, timestamp) for consecutive msgs
         climax_instances = []  # List of climax detections
-        current_streak = {'author': None, 'count': 0, 'start_timestamp': None}
-        
-        # Track profanities over time for patterns
-        profanity_timeline = defaultdict(int)
-        
-        prev_msg_had_profanity = False
-        prev_author = None
-        
-        for msg in messages:
-            if msg.is_system:
-                continue
-            
-            # Count messages per author (for per-capita calculation)
-            by_author_message_count[msg.author] += 1
-            
-            if msg.is_media or not msg.content:
-                prev_msg_had_profanity = False
+
+        # Mask work up front: per-author message counts come from one
+        # bincount, and the loop below visits only the user rows, testing
+        # the media/empty criterion against the columns instead of
+        # re-reading Message attributes
+        columns = self._materialize_columns()
+        authors = columns['authors']
+        user_mask = columns['user_mask']
+        text_ok = ~columns['is_media'] & (columns['content_len'] > 0)
+        user_author_counts = np.bincount(
+            columns['author_ids'][user_mask], minlength=len(authors)
+        )
+        by_author_message_count = {
+            authors[i]: int(user_author_counts[i])
+            for i in np.flatnonzero(user_author_counts)
+        }
+
+        # Scan pass: regex work over plain strings, sharded across worker
+        # processes for very large chats. The hits are attributed back to
+        # authors below, then the aggregation pass derives streaks and the
+        # timeline from compact (author, epoch_seconds, profanity_count)
+        # rows without touching Message objects or datetimes again.
+        messages = self.filtered_messages
+        user_indices = np.flatnonzero(user_mask)
+        # Epoch seconds straight from the datetime64 column; naive wall time
+        # in, naive wall time out (paired with utcfromtimestamp below), so no
+        # per-message .timestamp() call and no local-timezone dependence
+        ts_epoch = columns['ts'].astype(np.int64)
+        contents = [messages[i].content_lower for i in user_indices if text_ok[i]]
+        if len(contents) >= _PARALLEL_SCAN_MIN:
+            hits = _scan_contents_parallel(contents, self.language)
+        else:
+            hits = _scan_contents(contents, self.language)
+
+        scanned = []
+        hit_idx = 0
+
+        for i in user_indices:
+            msg = messages[i]
+
+            if not text_ok[i]:
+                # Media/empty breaks profanity adjacency; marked with count -1
+                scanned.append((msg.author, 0, -1))
                 continue
-            
-            # IMPORTANT: Normalize to lowercase for analysis
-            content = msg.content.lower()
+
+            hit = hits[hit_idx]
+            hit_idx += 1
             msg_profanity_count = 0
-            
-            for phrase, pattern in PROFANITY_PATTERNS.items():
-                matches = len(pattern.findall(content))
-                if matches > 0:
-                    by_phrase[phrase] += matches
-                    by_author[msg.author][phrase] += matches
-                    by_author_total[msg.author] += matches
-                    total += matches
-                    msg_profanity_count += matches
-            
-            # Detect climax patterns (mainly for Italian)
-            if self.language == 'it':
-                climax_in_msg = self._detect_climax_patterns(content)
-                for climax in climax_in_msg:
+
+            if hit is not None:
+                phrases, climaxes = hit
+                msg_profanity_count = len(phrases)
+                if phrases:
+                    for phrase in phrases:
+                        phrase_counts[phrase_index[phrase]] += 1
+                        by_author_phrase[(msg.author, phrase)] += 1
+                    by_author_total[msg.author] += msg_profanity_count
+                    total += msg_profanity_count
+                for climax in climaxes:
+                    # Epoch int for now; only the emitted instances get
+                    # an ISO string at return time
                     climax_instances.append({
                         'author': msg.author,
-                        'timestamp': msg.timestamp.isoformat() if msg.timestamp else None,
+                        'timestamp': int(ts_epoch[i]),
                         **climax
                     })
-            
-            # Track consecutive profanities (same author, consecutive messages)
-            if msg_profanity_count > 0:
-                # Track timeline
-                time_key = msg.timestamp.replace(minute=0, second=0, microsecond=0)
-                profanity_timeline[time_key.isoformat()] += msg_profanity_count
-                
-                if prev_msg_had_profanity and prev_author == msg.author:
-                    # Continue streak
-                    current_streak['count'] += 1
-                else:
-                    # Save previous streak if it was >= 2
-                    if current_streak['count'] >= 2:
-                        consecutive_profanities.append({
-                            'author': current_streak['author'],
-                            'count': current_streak['count'],
-                            'timestamp': current_streak['start_timestamp']
-                        })
-                    # Start new streak
-                    current_streak = {
-                        'author': msg.author,
-                        'count': 1,
-                        'start_timestamp': msg.timestamp.isoformat() if msg.timestamp else None
-                    }
-                prev_msg_had_profanity = True
-                prev_author = msg.author
-            else:
-                # No profanity in this message
-                if current_streak['count'] >= 2:
-                    consecutive_profanities.append({
-                        'author': current_streak['author'],
-                        'count': current_streak['count'],
-                        'timestamp': current_streak['start_timestamp']
-                    })
-                current_streak = {'author': None, 'count': 0, 'start_timestamp': None}
-                prev_msg_had_profanity = False
-                prev_author = msg.author
-        
-        # Don't forget last streak
-        if current_streak['count'] >= 2:
-            consecutive_profanities.append({
-                'author': current_streak['author'],
-                'count': current_streak['count'],
-                'timestamp': current_streak['start_timestamp']
-            })
-        
+
+            scanned.append((msg.author, int(ts_epoch[i]), msg_profanity_count))
+
+        # Aggregation pass over the compact rows
+        streak_rows, timeline_base, timeline_counts = self._aggregate_profanity(scanned)
+        consecutive_profanities = [
+            {
+                'author': author,
+                'count': count,
+                'timestamp': datetime.utcfromtimestamp(start_epoch).isoformat()
+            }
+            for author, count, start_epoch in streak_rows
+        ]
+
         # Calculate per-capita stats (profanities per 100 messages)
         per_capita = {}
         for author, profanity_count in by_author_total.items():
@@ -456,12 +662,13 @@ class StatisticsService:
         total_messages = sum(by_author_message_count.values())
         total_per_capita = round((total / total_messages) * 100, 2) if total_messages > 0 else 0
         
-        # Get top phrases (filter out zeros and sort by count)
-        top_phrases = sorted(
-            [(phrase, count) for phrase, count in by_phrase.items() if count > 0],
-            key=lambda x: x[1],
-            reverse=True
-        )[:20]  # Top 20
+        # Get top phrases (filter out zeros; heap select beats sorting the
+        # full phrase list for a top-20)
+        top_phrases = heapq.nlargest(
+            20,
+            ((phrases_list[i], int(phrase_counts[i])) for i in np.flatnonzero(phrase_counts)),
+            key=lambda x: x[1]
+        )
         
         # Climax statistics (mainly for Italian)
         climax_by_author = defaultdict(int)
@@ -471,42 +678,124 @@ class StatisticsService:
             total_intensity += climax['intensity']
         
         avg_climax_intensity = round(total_intensity / len(climax_instances), 2) if climax_instances else 0
-        
+
+        # Serialize timestamps only for the instances that leave this method
+        emitted_climaxes = climax_instances[:50]
+        for climax in emitted_climaxes:
+            if climax['timestamp'] is not None:
+                climax['timestamp'] = datetime.utcfromtimestamp(climax['timestamp']).isoformat()
+
+
+        # Unflatten the (author, phrase) counts; only pairs that actually
+        # occurred are present, so no zero filtering is needed
+        by_author = defaultdict(dict)
+        for (author, phrase), count in by_author_phrase.items():
+            by_author[author][phrase] = count
+
         return {
             'by_phrase': {phrase: count for phrase, count in top_phrases},
-            'by_author': {author: {p: c for p, c in counts.items() if c > 0} for author, counts in by_author.items() if by_author_total[author] > 0},
+            'by_author': dict(by_author),
             'by_author_total': dict(by_author_total),
             'total': total,
             'per_capita': per_capita,
             'total_per_capita': total_per_capita,
-            'consecutive_streaks': sorted(consecutive_profanities, key=lambda x: x['count'], reverse=True)[:10],
-            'climax_instances': climax_instances[:50],  # Limit to 50
+            'consecutive_streaks': heapq.nlargest(10, consecutive_profanities, key=lambda x: x['count']),
+            'climax_instances': emitted_climaxes,  # Limit to 50
             'climax_by_author': dict(climax_by_author),
             'avg_climax_intensity': avg_climax_intensity,
-            'timeline': dict(sorted(profanity_timeline.items())),
+            'timeline': {
+                datetime.utcfromtimestamp((timeline_base + hour) * 3600).isoformat(): int(count)
+                for hour, count in enumerate(timeline_counts.tolist()) if count
+            },
             'language': self.language,  # Include language for frontend
         }
 
+    @staticmethod
+    def _aggregate_profanity(scanned) -> tuple:
+        """
+        Walk the compact (author, epoch_seconds, profanity_count) rows from
+        the scan pass and derive consecutive streaks plus the hourly timeline.
+
+        Rows with count -1 are media/empty messages, which break profanity
+        adjacency without ending an open streak. Returns a list of
+        (author, count, start_epoch) streaks with count >= 2, the first
+        epoch-hour with profanity, and a dense int64 array of per-hour
+        counts starting at that hour.
+        """
+        streaks = []
+        # Parallel lists of (epoch-hour, count) pairs; binned once at the end
+        # instead of allocating a dict entry (or worse, an ISO string key)
+        # per profane message
+        timeline_hours = []
+        timeline_counts = []
+        streak_author = None
+        streak_count = 0
+        streak_start = 0
+        prev_had_profanity = False
+        prev_author = None
+
+        for author, epoch, count in scanned:
+            if count < 0:
+                prev_had_profanity = False
+                continue
+            if count > 0:
+                timeline_hours.append(epoch // 3600)
+                timeline_counts.append(count)
+                if prev_had_profanity and prev_author == author:
+                    # Continue streak
+                    streak_count += 1
+                else:
+                    # Save previous streak if it was >= 2, then start a new one
+                    if streak_count >= 2:
+                        streaks.append((streak_author, streak_count, streak_start))
+                    streak_author = author
+                    streak_count = 1
+                    streak_start = epoch
+                prev_had_profanity = True
+            else:
+                # No profanity in this message
+                if streak_count >= 2:
+                    streaks.append((streak_author, streak_count, streak_start))
+                streak_author = None
+                streak_count = 0
+                prev_had_profanity = False
+            prev_author = author
+
+        # Don't forget the last streak
+        if streak_count >= 2:
+            streaks.append((streak_author, streak_count, streak_start))
+
+        if timeline_hours:
+            hours = np.asarray(timeline_hours, dtype=np.int64)
+            base_hour = int(hours.min())
+            hour_counts = np.bincount(
+                hours - base_hour,
+                weights=np.asarray(timeline_counts, dtype=np.int64)
+            ).astype(np.int64)
+        else:
+            base_hour = 0
+            hour_counts = np.zeros(0, dtype=np.int64)
+
+        return streaks, base_hour, hour_counts
+
     def _compute_hourly_breakdown(self, messages: List[Message]) -> List[TimeSeriesDataPoint]:
         """Compute hourly breakdown (0-23 hours) across all messages."""
-        hourly_counts = defaultdict(int)
-        
-        # Aggregate messages by hour of day (0-23)
-        for msg in messages:
-            hour = msg.timestamp.hour
-            hourly_counts[hour] += 1
-        
+        # Aggregate messages by hour of day (0-23) in a single bincount
+        ts = np.array([m.timestamp for m in messages], dtype='datetime64[s]')
+        hours = ts.astype('datetime64[h]').astype(np.int64) % 24
+        hourly_counts = np.bincount(hours, minlength=24)
+
         # Convert to TimeSeriesDataPoint format with hour as timestamp (using a reference date)
         # Include all 24 hours, even if count is 0
         reference_date = datetime(2000, 1, 1)  # Arbitrary reference date
         series = [
             TimeSeriesDataPoint(
                 timestamp=reference_date.replace(hour=hour),
-                value=hourly_counts.get(hour, 0)
+                value=int(hourly_counts[hour])
             )
             for hour in range(24)
         ]
-        
+
         return series
     
     def _empty_stats_response(self) -> StatsResponse:
@@ -7,11 +7,18 @@ from ..models.message import Message
 from ..models.stats import WordFrequencyItem, WordFrequencyResponse
 
 
+# Single-pass tokenizer: URLs and e-mail addresses are consumed (and
+# discarded) by the leading alternatives, word runs are captured by the
+# group. Replaces the former three re.sub sweeps plus a findall, each of
+# which copied the whole string.
+_TOKEN_RE = re.compile(r"http\S+|www\.\S+|\S+@\S+|(\w+)", re.UNICODE)
+
+
 class WordAnalyzer:
     """Analyzes word frequency in messages."""
     
-    # Common stopwords in Italian and English
-    STOPWORDS = {
+    # Common stopwords in Italian and English (frozen: shared, never mutated)
+    STOPWORDS = frozenset({
         # Italian articles
         'il', 'lo', 'la', 'i', 'gli', 'le', 'un', 'uno', 'una', 'dei', 'degli', 'delle', 'del', 'della', 'dello', 'dell',
         # Italian prepositions
@@ -37,7 +44,7 @@ class WordAnalyzer:
         'very', 'much', 'many', 'more', 'most', 'less', 'least',
         # Media markers
         '<media', 'omitted>', 'media'
-    }
+    })
     
     def __init__(self, messages: List[Message]):
         self.messages = messages
@@ -72,34 +79,26 @@ class WordAnalyzer:
         if end_date:
             filtered = [m for m in filtered if m.timestamp <= end_date]
         
-        # Extract words
-        words = []
+        # Count frequencies per message without materializing one giant
+        # token list; short tokens and stopwords are filtered before they
+        # ever enter the counter
+        word_counts = Counter()
+        stopwords = self.STOPWORDS
         for msg in filtered:
             if msg.is_media or msg.is_system or not msg.content:
                 continue
-            
-            msg_words = self._extract_words(msg.content)
-            words.extend(msg_words)
-        
-        # Count frequencies
-        word_counts = Counter(words)
-        
-        # Filter by minimum length and stopwords
-        filtered_counts = {
-            word: count
-            for word, count in word_counts.items()
-            if len(word) >= min_length and word.lower() not in self.STOPWORDS
-        }
-        
-        # Sort by frequency
-        sorted_words = sorted(filtered_counts.items(), key=lambda x: x[1], reverse=True)
-        
-        # Limit results
-        top_words = sorted_words[:limit]
-        
+
+            word_counts.update(
+                w for w in self._extract_words(msg.content_lower)
+                if len(w) >= min_length and w not in stopwords
+            )
+
+        # Top N via most_common's heap select rather than a full sort
+        top_words = word_counts.most_common(limit)
+
         # Calculate total and frequencies
-        total_words = sum(count for _, count in filtered_counts.items())
-        unique_words = len(filtered_counts)
+        total_words = sum(word_counts.values())
+        unique_words = len(word_counts)
         
         word_items = [
             WordFrequencyItem(
@@ -130,21 +129,12 @@ class WordAnalyzer:
         )
     
     def _extract_words(self, text: str) -> List[str]:
-        """Extract words from text, handling multiple languages."""
-        # Remove URLs
-        text = re.sub(r'http\S+|www\.\S+', '', text)
-        # Remove email addresses
-        text = re.sub(r'\S+@\S+', '', text)
-        # Remove special characters but keep accents and unicode
-        # Keep letters (including accented) and apostrophes
-        text = re.sub(r'[^\w\s\']', ' ', text, flags=re.UNICODE)
-        
-        # Split into words
-        words = re.findall(r'\b\w+\b', text, re.UNICODE)
-        
-        # Convert to lowercase and filter
-        words = [w.lower() for w in words if w]
-        
-        return words
+        """
+        Extract words from text, handling multiple languages.
+        Expects already-lowercased text (Message.content_lower).
+        """
+        # One scan: skip URLs/emails, keep word runs (accents and unicode
+        # included via \w; already lowercase, so no per-token .lower())
+        return [m.group(1) for m in _TOKEN_RE.finditer(text) if m.group(1)]
 
 
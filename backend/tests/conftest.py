@@ -0,0 +1,57 @@
+"""Shared fixtures for the test suite.
+
+Everything here is read-only (Message objects are never mutated by the
+tests and EmojiAnalyzer([]) holds no state), so the fixtures are
+session-scoped: each pytest process builds them once, which also keeps
+them cheap under parallel runners like pytest-xdist.
+"""
+import pytest
+
+from app.models.message import Message
+from app.services.emoji_analysis import EmojiAnalyzer
+
+
+def _msg(content, author="Alice", timestamp="2024-01-01T10:00:00",
+         is_system=False, is_media=False):
+    """Helper to build a Message with sensible defaults."""
+    return Message(
+        timestamp=timestamp,
+        author=author,
+        content=content,
+        is_system=is_system,
+        is_media=is_media
+    )
+
+
+@pytest.fixture(scope="session")
+def make_msg():
+    """The _msg helper as a fixture, so test modules share one copy."""
+    return _msg
+
+
+@pytest.fixture(scope="session")
+def empty_analyzer():
+    """Analyzer over no messages, shared by the stateless tests."""
+    return EmojiAnalyzer([])
+
+
+@pytest.fixture(scope="session")
+def alice_hello_smile():
+    """A plain single-emoji message, shared by several analyze tests."""
+    return _msg("Hello 😀")
+
+
+@pytest.fixture(scope="session")
+def alice_hello_two_smiles():
+    """A two-emoji message, shared by several analyze tests."""
+    return _msg("Hello 😀 😃")
+
+
+@pytest.fixture(scope="session")
+def alice_sorted_smiles_result():
+    """analyze() over a message with 3x😀, 2x😃, 1x😄, computed once.
+
+    Shared by the tests that only read the result (sorting, by_author
+    structure), so the analysis runs once per session instead of per test.
+    """
+    return EmojiAnalyzer([_msg("😀 😀 😀 😃 😃 😄")]).analyze()
@@ -1,62 +1,46 @@
 """Unit tests for emoji analysis service."""
 import pytest
-from app.models.message import Message
 from app.services.emoji_analysis import EmojiAnalyzer
 
 
+EXPECTED_TOP_SORTED = [
+    {'emoji': "😀", 'count': 3},
+    {'emoji': "😃", 'count': 2},
+    {'emoji': "😄", 'count': 1},
+]
+
+EXPECTED_BY_AUTHOR = {
+    'Alice': {'total': 2, 'unique': 1},
+    'Bob': {'total': 1, 'unique': 1},
+}
+
+
 class TestEmojiAnalyzer:
     """Test suite for EmojiAnalyzer service."""
-    
-    def test_extract_emojis_single(self):
-        """Test extracting a single emoji from text."""
-        messages = []
-        analyzer = EmojiAnalyzer(messages)
-        
-        emojis = analyzer.extract_emojis("Hello 😀 world")
-        assert len(emojis) == 1
-        assert emojis[0] == "😀"
-    
-    def test_extract_emojis_multiple(self):
-        """Test extracting multiple emojis from text."""
-        messages = []
-        analyzer = EmojiAnalyzer(messages)
-        
-        emojis = analyzer.extract_emojis("😀 😃 😄 😁")
-        assert len(emojis) == 4
-        assert "😀" in emojis
-        assert "😃" in emojis
-    
-    def test_extract_emojis_no_emojis(self):
-        """Test extracting from text without emojis."""
-        messages = []
-        analyzer = EmojiAnalyzer(messages)
-        
-        emojis = analyzer.extract_emojis("Hello world")
-        assert len(emojis) == 0
-    
-    def test_analyze_empty_messages(self):
+
+    @pytest.mark.parametrize("text,expected", [
+        ("Hello 😀 world", ["😀"]),
+        ("😀 😃 😄 😁", ["😀", "😃", "😄", "😁"]),
+        ("Hello world", []),
+    ])
+    def test_extract_emojis(self, empty_analyzer, text, expected):
+        """Test extracting zero, one or several emojis from text."""
+        emojis = empty_analyzer.extract_emojis(text)
+        assert len(emojis) == len(expected)
+        assert set(emojis) == set(expected)
+
+    def test_analyze_empty_messages(self, empty_analyzer):
         """Test analyzing with no messages."""
-        messages = []
-        analyzer = EmojiAnalyzer(messages)
-        result = analyzer.analyze()
-        
+        result = empty_analyzer.analyze()
+
         assert result['total_emojis'] == 0
         assert result['unique_emojis'] == 0
         assert result['top_emojis'] == []
         assert result['by_author'] == {}
     
-    def test_analyze_single_emoji_single_author(self):
+    def test_analyze_single_emoji_single_author(self, alice_hello_smile):
         """Test analyzing a single emoji from one author."""
-        messages = [
-            Message(
-                timestamp="2024-01-01T10:00:00",
-                author="Alice",
-                content="Hello 😀",
-                is_system=False,
-                is_media=False
-            )
-        ]
-        analyzer = EmojiAnalyzer(messages)
+        analyzer = EmojiAnalyzer([alice_hello_smile])
         result = analyzer.analyze()
         
         assert result['total_emojis'] == 1
@@ -67,51 +51,28 @@ class TestEmojiAnalyzer:
         assert 'Alice' in result['by_author']
         assert result['by_author']['Alice']['total'] == 1
     
-    def test_analyze_multiple_authors(self):
+    def test_analyze_multiple_authors(self, make_msg):
         """Test analyzing emojis from multiple authors."""
         messages = [
-            Message(
-                timestamp="2024-01-01T10:00:00",
-                author="Alice",
-                content="Hello 😀 😀",
-                is_system=False,
-                is_media=False
-            ),
-            Message(
-                timestamp="2024-01-01T10:01:00",
-                author="Bob",
-                content="Hi 😀",
-                is_system=False,
-                is_media=False
-            )
+            make_msg("Hello 😀 😀"),
+            make_msg("Hi 😀", author="Bob", timestamp="2024-01-01T10:01:00"),
         ]
         analyzer = EmojiAnalyzer(messages)
         result = analyzer.analyze()
         
         assert result['total_emojis'] == 3
         assert result['unique_emojis'] == 1
-        assert len(result['by_author']) == 2
-        assert result['by_author']['Alice']['total'] == 2
-        assert result['by_author']['Bob']['total'] == 1
-        assert result['by_author']['Alice']['unique'] == 1
-        assert result['by_author']['Bob']['unique'] == 1
+        assert {
+            author: {'total': data['total'], 'unique': data['unique']}
+            for author, data in result['by_author'].items()
+        } == EXPECTED_BY_AUTHOR
     
-    def test_analyze_by_author_is_dict_not_module(self):
+    def test_analyze_by_author_is_dict_not_module(self, alice_sorted_smiles_result):
         """Test that by_author contains proper dictionaries, not module objects.
-        
+
         This test specifically catches the bug where emoji module was used as dict key.
         """
-        messages = [
-            Message(
-                timestamp="2024-01-01T10:00:00",
-                author="Alice",
-                content="Hello 😀 😃",
-                is_system=False,
-                is_media=False
-            )
-        ]
-        analyzer = EmojiAnalyzer(messages)
-        result = analyzer.analyze()
+        result = alice_sorted_smiles_result
         
         # Check that by_author is properly structured
         assert isinstance(result['by_author'], dict)
@@ -124,55 +85,25 @@ class TestEmojiAnalyzer:
         assert 'top_emojis' in author_data
         assert isinstance(author_data['top_emojis'], list)
         
-        for emoji_entry in author_data['top_emojis']:
-            assert 'emoji' in emoji_entry
-            assert 'count' in emoji_entry
-            # Ensure it's a string, not the emoji module
-            assert isinstance(emoji_entry['emoji'], str)
-            assert isinstance(emoji_entry['count'], int)
-            # Make sure it's an actual emoji, not a module object
-            assert len(emoji_entry['emoji']) > 0
-            assert emoji_entry['emoji'] != 'emoji'  # Not the module name
+        # Every entry must be a non-empty emoji string with an int count,
+        # not the emoji module (or its name) leaking through as a key
+        entries = author_data['top_emojis']
+        assert all(
+            isinstance(e['emoji'], str) and isinstance(e['count'], int)
+            and e['emoji'] and e['emoji'] != 'emoji'
+            for e in entries
+        )
     
-    def test_analyze_top_emojis_sorted(self):
+    def test_analyze_top_emojis_sorted(self, alice_sorted_smiles_result):
         """Test that top emojis are sorted by count."""
-        messages = [
-            Message(
-                timestamp="2024-01-01T10:00:00",
-                author="Alice",
-                content="😀 😀 😀 😃 😃 😄",
-                is_system=False,
-                is_media=False
-            )
-        ]
-        analyzer = EmojiAnalyzer(messages)
-        result = analyzer.analyze()
-        
-        top = result['top_emojis']
-        assert top[0]['emoji'] == "😀"
-        assert top[0]['count'] == 3
-        assert top[1]['emoji'] == "😃"
-        assert top[1]['count'] == 2
-        assert top[2]['emoji'] == "😄"
-        assert top[2]['count'] == 1
+        assert alice_sorted_smiles_result['top_emojis'][:3] == EXPECTED_TOP_SORTED
     
-    def test_analyze_ignores_system_messages(self):
+    def test_analyze_ignores_system_messages(self, alice_hello_smile, make_msg):
         """Test that system messages are excluded from analysis."""
         messages = [
-            Message(
-                timestamp="2024-01-01T10:00:00",
-                author="Alice",
-                content="Hello 😀",
-                is_system=False,
-                is_media=False
-            ),
-            Message(
-                timestamp="2024-01-01T10:01:00",
-                author="System",
-                content="Alice changed the group name 😀",
-                is_system=True,
-                is_media=False
-            )
+            alice_hello_smile,
+            make_msg("Alice changed the group name 😀", author="System",
+                     timestamp="2024-01-01T10:01:00", is_system=True),
         ]
         analyzer = EmojiAnalyzer(messages)
         result = analyzer.analyze()
@@ -181,23 +112,12 @@ class TestEmojiAnalyzer:
         assert result['total_emojis'] == 1
         assert 'System' not in result['by_author']
     
-    def test_analyze_ignores_media_messages(self):
+    def test_analyze_ignores_media_messages(self, alice_hello_smile, make_msg):
         """Test that media-only messages are excluded from analysis."""
         messages = [
-            Message(
-                timestamp="2024-01-01T10:00:00",
-                author="Alice",
-                content="Hello 😀",
-                is_system=False,
-                is_media=False
-            ),
-            Message(
-                timestamp="2024-01-01T10:01:00",
-                author="Bob",
-                content="<Media omitted> 😀",
-                is_system=False,
-                is_media=True
-            )
+            alice_hello_smile,
+            make_msg("<Media omitted> 😀", author="Bob",
+                     timestamp="2024-01-01T10:01:00", is_media=True),
         ]
         analyzer = EmojiAnalyzer(messages)
         result = analyzer.analyze()
@@ -206,23 +126,11 @@ class TestEmojiAnalyzer:
         assert result['total_emojis'] == 1
         assert 'Bob' not in result['by_author']
     
-    def test_analyze_emojis_per_message(self):
+    def test_analyze_emojis_per_message(self, alice_hello_two_smiles, make_msg):
         """Test emojis per message calculation."""
         messages = [
-            Message(
-                timestamp="2024-01-01T10:00:00",
-                author="Alice",
-                content="Hello 😀 😃",
-                is_system=False,
-                is_media=False
-            ),
-            Message(
-                timestamp="2024-01-01T10:01:00",
-                author="Alice",
-                content="World 😄",
-                is_system=False,
-                is_media=False
-            )
+            alice_hello_two_smiles,
+            make_msg("World 😄", timestamp="2024-01-01T10:01:00"),
         ]
         analyzer = EmojiAnalyzer(messages)
         result = analyzer.analyze()
@@ -0,0 +1,236 @@
+"""Unit tests for the statistics service."""
+from datetime import datetime
+
+from app.services.statistics import StatisticsService
+
+
+class TestStatisticsService:
+    """Test suite for StatisticsService."""
+
+    def test_compute_stats_basic_totals(self, make_msg):
+        """Test total message and author counts."""
+        messages = [
+            make_msg("Hello"),
+            make_msg("Hi there", author="Bob"),
+            make_msg("How are you?"),
+        ]
+        stats = StatisticsService(messages).compute_stats()
+
+        assert stats.total_messages == 3
+        assert stats.total_authors == 2
+
+    def test_compute_stats_excludes_system_messages(self, make_msg):
+        """Test that system messages are not counted."""
+        messages = [
+            make_msg("Hello"),
+            make_msg("Alice changed the group name", author="System", is_system=True),
+        ]
+        stats = StatisticsService(messages).compute_stats()
+
+        assert stats.total_messages == 1
+        assert stats.total_authors == 1
+
+    def test_author_stats_counts_and_lengths(self, make_msg):
+        """Test per-author message counts and average lengths."""
+        messages = [
+            make_msg("abcd"),
+            make_msg("ab"),
+            make_msg("abcdef", author="Bob"),
+        ]
+        stats = StatisticsService(messages).compute_stats()
+
+        by_author = {a.author: a for a in stats.author_stats}
+        assert by_author["Alice"].message_count == 2
+        assert by_author["Alice"].avg_message_length == 3
+        assert by_author["Alice"].total_chars == 6
+        assert by_author["Bob"].message_count == 1
+        assert by_author["Bob"].total_chars == 6
+
+    def test_media_stats(self, make_msg):
+        """Test media counting per author."""
+        messages = [
+            make_msg("Hello"),
+            make_msg("", is_media=True),
+            make_msg("", author="Bob", is_media=True),
+        ]
+        stats = StatisticsService(messages).compute_stats()
+
+        assert stats.media_stats.total_media == 2
+        assert stats.media_stats.media_by_author == {"Alice": 1, "Bob": 1}
+
+    def test_time_series_day_grouping(self, make_msg):
+        """Test that the time series buckets messages per day."""
+        messages = [
+            make_msg("a", timestamp="2024-01-01T10:00:00"),
+            make_msg("b", timestamp="2024-01-01T15:00:00"),
+            make_msg("c", timestamp="2024-01-02T09:00:00"),
+        ]
+        stats = StatisticsService(messages).compute_stats(time_group='day')
+
+        assert len(stats.time_series) == 2
+        assert stats.time_series[0].timestamp == datetime(2024, 1, 1)
+        assert stats.time_series[0].value == 2
+        assert stats.time_series[1].timestamp == datetime(2024, 1, 2)
+        assert stats.time_series[1].value == 1
+
+    def test_hourly_breakdown_has_24_points(self, make_msg):
+        """Test that hourly breakdown always covers all 24 hours."""
+        messages = [make_msg("a", timestamp="2024-01-01T10:00:00")]
+        stats = StatisticsService(messages).compute_stats(time_group='day')
+
+        hourly = stats.grouped_data['hourly']
+        assert len(hourly) == 24
+        assert sum(p.value for p in hourly) == 1
+        assert hourly[10].value == 1
+
+    def test_filter_messages_by_author(self, make_msg):
+        """Test filtering down to a single author."""
+        messages = [
+            make_msg("a"),
+            make_msg("b", author="Bob"),
+        ]
+        filtered = StatisticsService(messages).filter_messages(authors=["Bob"])
+        stats = filtered.compute_stats()
+
+        assert stats.total_messages == 1
+        assert stats.author_stats[0].author == "Bob"
+
+    def test_filter_messages_by_date(self, make_msg):
+        """Test filtering by a date range."""
+        messages = [
+            make_msg("a", timestamp="2024-01-01T10:00:00"),
+            make_msg("b", timestamp="2024-02-01T10:00:00"),
+            make_msg("c", timestamp="2024-03-01T10:00:00"),
+        ]
+        filtered = StatisticsService(messages).filter_messages(
+            start_date=datetime(2024, 1, 15),
+            end_date=datetime(2024, 2, 15)
+        )
+        stats = filtered.compute_stats()
+
+        assert stats.total_messages == 1
+
+    def test_bestemmiometro_counts_italian_phrases(self, make_msg):
+        """Test that Italian blasphemies are counted by phrase and author."""
+        messages = [
+            make_msg("porco dio che giornata"),
+            make_msg("oggi tutto bene", author="Bob"),
+            make_msg("dio cane!", author="Bob"),
+        ]
+        service = StatisticsService(messages, language='it')
+        result = service.compute_stats().grouped_data['bestemmiometro']
+
+        assert result['total'] == 2
+        assert result['by_phrase'].get('porco dio') == 1
+        assert result['by_phrase'].get('dio cane') == 1
+        assert result['by_author_total'] == {'Alice': 1, 'Bob': 1}
+
+    def test_bestemmiometro_is_case_insensitive(self, make_msg):
+        """Test that uppercase text is still matched."""
+        messages = [make_msg("PORCO DIO")]
+        service = StatisticsService(messages, language='it')
+        result = service.compute_stats().grouped_data['bestemmiometro']
+
+        assert result['total'] == 1
+
+    def test_bestemmiometro_counts_repeated_matches(self, make_msg):
+        """Test that repeated phrases in one message are all counted."""
+        messages = [make_msg("porco dio porco dio porco dio")]
+        service = StatisticsService(messages, language='it')
+        result = service.compute_stats().grouped_data['bestemmiometro']
+
+        assert result['total'] == 3
+        assert result['by_phrase']['porco dio'] == 3
+
+    def test_bestemmiometro_english_swearwords(self, make_msg):
+        """Test the English swear-o-meter path."""
+        messages = [
+            make_msg("what the fuck"),
+            make_msg("all good here", author="Bob"),
+        ]
+        service = StatisticsService(messages, language='en')
+        result = service.compute_stats().grouped_data['bestemmiometro']
+
+        assert result['total'] >= 1
+        assert result['by_author_total'].get('Alice', 0) >= 1
+        assert 'Bob' not in result['by_author_total']
+
+    def test_bestemmiometro_clean_conversation(self, make_msg):
+        """Test that a clean conversation reports zero profanities."""
+        messages = [
+            make_msg("ciao come stai"),
+            make_msg("tutto bene grazie", author="Bob"),
+        ]
+        service = StatisticsService(messages, language='it')
+        result = service.compute_stats().grouped_data['bestemmiometro']
+
+        assert result['total'] == 0
+        assert result['by_phrase'] == {}
+
+    def test_bestemmiometro_per_capita(self, make_msg):
+        """Test per-capita profanity rates (per 100 messages)."""
+        messages = [
+            make_msg("porco dio"),
+            make_msg("ciao"),
+            make_msg("ciao", author="Bob"),
+        ]
+        service = StatisticsService(messages, language='it')
+        result = service.compute_stats().grouped_data['bestemmiometro']
+
+        assert result['per_capita']['Alice'] == 50.0
+        assert result['total_per_capita'] == round(1 / 3 * 100, 2)
+
+    def test_bestemmiometro_consecutive_streaks(self, make_msg):
+        """Test that consecutive profane messages from one author form a streak."""
+        messages = [
+            make_msg("porco dio", timestamp="2024-01-01T10:00:00"),
+            make_msg("dio cane", timestamp="2024-01-01T10:01:00"),
+            make_msg("ciao", author="Bob", timestamp="2024-01-01T10:02:00"),
+        ]
+        service = StatisticsService(messages, language='it')
+        result = service.compute_stats().grouped_data['bestemmiometro']
+
+        streaks = result['consecutive_streaks']
+        assert len(streaks) == 1
+        assert streaks[0]['author'] == 'Alice'
+        assert streaks[0]['count'] == 2
+
+    def test_climax_detection_is_case_insensitive(self, make_msg):
+        """Test that shouted climaxes are still detected."""
+        messages = [make_msg("DIOOOOO")]
+        service = StatisticsService(messages, language='it')
+        result = service.compute_stats().grouped_data['bestemmiometro']
+
+        assert len(result['climax_instances']) == 1
+
+    def test_climax_detection(self, make_msg):
+        """Test climax detection on repeated trailing vowels."""
+        messages = [make_msg("diooooo")]
+        service = StatisticsService(messages, language='it')
+        result = service.compute_stats().grouped_data['bestemmiometro']
+
+        assert len(result['climax_instances']) == 1
+        assert result['climax_instances'][0]['author'] == 'Alice'
+        assert result['climax_by_author'] == {'Alice': 1}
+
+    def test_message_length_distribution(self, make_msg):
+        """Test the length histogram excludes media and empty content."""
+        messages = [
+            make_msg("abc"),
+            make_msg("abcde", author="Bob"),
+            make_msg("", is_media=True),
+        ]
+        stats = StatisticsService(messages).compute_stats()
+
+        hist = stats.grouped_data['message_lengths']
+        assert hist['bins'][3] == 1
+        assert hist['bins'][5] == 1
+        assert sum(hist['bins']) == 2
+
+    def test_empty_messages(self):
+        """Test the empty-conversation response."""
+        stats = StatisticsService([]).compute_stats()
+
+        assert stats.total_messages == 0
+        assert stats.total_authors == 0
+        assert stats.time_series == []
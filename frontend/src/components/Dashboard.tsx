@@ -819,7 +819,7 @@ export function Dashboard({ onSessionExpired }: DashboardProps) {
           </>
         )}
         
-        {stats.grouped_data?.message_lengths && stats.grouped_data.message_lengths.length > 0 && (
+        {stats.grouped_data?.message_lengths && stats.grouped_data.message_lengths.bins.length > 0 && (
           <div style={{ backgroundColor: '#fff', border: '1px solid #e0e0e0', borderRadius: '8px' }}>
             <div style={{ padding: '50px' }}>
               <MessageLengthHistogram messageLengths={stats.grouped_data.message_lengths} lang={lang} />
@@ -26,7 +26,6 @@ interface SharedSnapshot {
   emoji_stats: EmojiStatsResponse;
   language: string;
   created_at: string;
-  expires_at: string;
 }
 
 export function SharedDashboard({ shareId }: SharedDashboardProps) {
@@ -1,14 +1,15 @@
 import { BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, Legend, ResponsiveContainer } from 'recharts';
 import { getTranslations, Language } from '../../i18n/translations';
+import { MessageLengthHistogramData } from '../../types';
 
 interface MessageLengthHistogramProps {
-  messageLengths: number[];
+  messageLengths: MessageLengthHistogramData;
   lang: Language;
 }
 
 export function MessageLengthHistogram({ messageLengths, lang }: MessageLengthHistogramProps) {
   const tr = getTranslations(lang);
-  
+
   // Define bins for message length (0-50, 50-100, 100-200, 200-500, 500-1000, 1000+)
   const bins = [
     { range: '0-50', min: 0, max: 50 },
@@ -19,11 +20,14 @@ export function MessageLengthHistogram({ messageLengths, lang }: MessageLengthHi
     { range: '1000+', min: 1000, max: Infinity },
   ];
 
-  // Count messages in each bin
+  // Sum the per-length counts from the backend histogram into each bin
+  const counts = messageLengths.bins;
   const binData = bins.map(bin => {
-    const count = messageLengths.filter(length => 
-      length >= bin.min && length < bin.max
-    ).length;
+    const upper = Math.min(bin.max, counts.length);
+    let count = 0;
+    for (let i = bin.min; i < upper; i++) {
+      count += counts[i];
+    }
     return {
       range: bin.range,
       count,
@@ -46,4 +50,3 @@ export function MessageLengthHistogram({ messageLengths, lang }: MessageLengthHi
     </div>
   );
 }
-
@@ -39,11 +39,18 @@ export interface StatsResponse {
   grouped_data: {
     by_author?: Record<string, TimeSeriesDataPoint[]>;
     hourly?: TimeSeriesDataPoint[];
-    message_lengths?: number[];
+    message_lengths?: MessageLengthHistogramData;
     bestemmiometro?: BestemmiometroData;
   };
 }
 
+export interface MessageLengthHistogramData {
+  // bins[i] = number of messages of length i; lengths above max are
+  // clamped into the last bin
+  bins: number[];
+  max: number;
+}
+
 export interface BestemmiometroData {
   by_phrase: Record<string, number>;
   by_author: Record<string, Record<string, number>>;